@@ -28,7 +28,8 @@ Optionnel : des mots-clés fallback (utile si meta.num est manquant).
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import List, Optional
+from functools import cached_property
+from typing import List, Optional, Tuple
 
 
 @dataclass(frozen=True)
@@ -39,6 +40,16 @@ class BenchmarkQueryV2:
     relevant_num_prefixes: List[str]
     relevant_keywords_fallback: Optional[List[str]] = None
 
+    @cached_property
+    def num_prefixes(self) -> Tuple[str, ...]:
+        """
+        Préfixes meta.num sous forme de tuple (construit une seule fois).
+
+        Permet `num.startswith(q.num_prefixes)` : tous les préfixes testés
+        en un seul appel C, sans boucle Python (cf. is_relevant_v2, script 10).
+        """
+        return tuple(self.relevant_num_prefixes)
+
 
 def get_benchmark_queries_v2() -> List[BenchmarkQueryV2]:
     """
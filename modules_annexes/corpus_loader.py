@@ -16,58 +16,44 @@ Ce module est volontairement agnostique :
 
 Il garantit que toutes les expériences de retrieval
 reposent sur exactement le même périmètre documentaire.
+
+L'extraction et le chargement XML sont ceux de corpus_loader_jsonl
+(réexportés ici) : une seule implémentation à maintenir.
 """
 
-import os
-import xml.etree.ElementTree as ET
+from corpus_loader_jsonl import (
+    extract_text_from_xml,
+    filter_documents_by_substring as _filter_documents_by_substring,
+    load_documents_from_xml,
+)
 
 # Racine des données Légifrance
 DATA_ROOT = r"D:\-- Projet RAG Avocats --\data_main\data"
 
+# Historique du module : documents conservés si len(text) > 200.
+MIN_TEXT_LEN = 201
 
-def extract_text_from_xml(xml_path):
-    """
-    Extrait de manière robuste tout le texte d'un fichier XML.
 
-    Hypothèse volontairement simple pour un POC pédagogique :
-    - tout le texte est concaténé
-    - aucune tentative fine de parsing juridique
-    """
-    try:
-        tree = ET.parse(xml_path)
-        root = tree.getroot()
-        texts = []
-        for elem in root.iter():
-            if elem.text:
-                texts.append(elem.text.strip())
-        return " ".join(texts)
-    except Exception:
-        return None
-
-
-def load_documents(data_root):
+def load_documents(data_root, min_text_len=MIN_TEXT_LEN, n_workers=1, required_substring=None):
     """
-    Parcourt récursivement les fichiers XML et construit le corpus.
+    Parcourt récursivement les fichiers XML et construit le corpus
+    (cf. corpus_loader_jsonl.load_documents_from_xml).
+
+    Valeurs par défaut historiques de ce module :
+    - min_text_len=MIN_TEXT_LEN (len(text) > 200)
+    - n_workers=1 : chargement séquentiel. Le pool de processus est optionnel :
+      sous Windows (spawn), chaque worker ré-importe le script appelant, et les
+      scripts qui chargent `documents` hors garde __main__ relanceraient un pool.
 
     Retour :
     - liste de dictionnaires {doc_id, text}
     """
-    documents = []
-
-    for root_dir, _, files in os.walk(data_root):
-        for file in files:
-            if file.lower().endswith(".xml"):
-                full_path = os.path.join(root_dir, file)
-                text = extract_text_from_xml(full_path)
-
-                # Filtre minimal pour éviter les documents trop pauvres
-                if text and len(text) > 200:
-                    documents.append({
-                        "doc_id": full_path,
-                        "text": text
-                    })
-
-    return documents
+    return load_documents_from_xml(
+        data_root,
+        min_text_len=min_text_len,
+        n_workers=n_workers,
+        required_substring=required_substring,
+    )
 
 
 def filter_documents_by_substring(documents, required_substring):
@@ -78,24 +64,75 @@ def filter_documents_by_substring(documents, required_substring):
     Objectif :
     - Réduire le bruit inter-code
     - Conserver un périmètre métier cohérent
+
+    Seul le champ "text" est inspecté (cf. corpus_loader_jsonl pour les autres champs).
     """
-    required = required_substring.lower()
-    return [
-        doc for doc in documents
-        if required in doc["text"].lower()
-    ]
+    return _filter_documents_by_substring(documents, required_substring, search_in=("text",))
 
 
 # =========================
-# Chargement effectif
+# Chargement effectif (à la demande)
 # =========================
 
-documents_raw = load_documents(DATA_ROOT)
-print(f"Corpus brut chargé : {len(documents_raw)} documents")
+CODE_DU_TRAVAIL = "Code du travail"
+
+_documents_raw = None
+_documents = None
+
+
+def get_documents_raw():
+    """
+    Charge le corpus brut (tous les XML) au premier appel puis le garde en mémoire.
+    """
+    global _documents_raw
+    if _documents_raw is None:
+        _documents_raw = load_documents(DATA_ROOT)
+        print(f"Corpus brut chargé : {len(_documents_raw)} documents")
+    return _documents_raw
+
+
+def get_documents():
+    """
+    Charge le corpus filtré 'Code du travail' au premier appel.
+
+    - corpus brut déjà en mémoire : simple filtre sur le texte
+    - sinon : chargement direct filtré à l'extraction (required_substring),
+      sans garder en mémoire les documents hors périmètre
+
+    Même filtre exact sur le texte extrait dans les deux cas : le résultat
+    ne dépend pas de l'ordre d'accès.
+    """
+    global _documents
+    if _documents is None:
+        if _documents_raw is not None:
+            _documents = filter_documents_by_substring(_documents_raw, CODE_DU_TRAVAIL)
+        else:
+            _documents = load_documents(DATA_ROOT, required_substring=CODE_DU_TRAVAIL)
+        print(f"Corpus filtré 'Code du travail' : {len(_documents)} documents")
+    return _documents
+
+
+def get_corpus():
+    """
+    Aucun chargement à l'import (Spyder/REPL, processus de travail).
+
+    Retour :
+    - (documents_raw, documents) : corpus brut et corpus filtré 'Code du travail'
+    """
+    return get_documents_raw(), get_documents()
+
+
+def __getattr__(name):
+    """
+    Compatibilité : `from corpus_loader import documents` fonctionne toujours,
+    le chargement n'a lieu qu'au premier accès.
+    """
+    if name == "documents_raw":
+        return get_documents_raw()
+    if name == "documents":
+        return get_documents()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
-documents = filter_documents_by_substring(
-    documents_raw,
-    "Code du travail"
-)
 
-print(f"Corpus filtré 'Code du travail' : {len(documents)} documents")
+if __name__ == "__main__":
+    get_corpus()
@@ -39,24 +39,69 @@ from __future__ import annotations
 import json
 import os
 import re
-import xml.etree.ElementTree as ET
-from typing import Any, Dict, Iterable, List, Optional, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+try:  # lxml (binding libxml2) : parsing natif, nettement plus rapide
+    from lxml import etree as ET
+
+    _XML_PARSE_ERRORS = (ET.XMLSyntaxError, ET.ParseError)
+except ImportError:  # repli stdlib
+    import xml.etree.ElementTree as ET
+
+    _XML_PARSE_ERRORS = (ET.ParseError,)
+
+try:  # orjson (Rust) : décodage JSON 2-3x plus rapide, accepte directement des bytes
+    import orjson
+
+    _json_loads = orjson.loads
+    _JSONDecodeError = orjson.JSONDecodeError
+except ImportError:  # repli stdlib (json.loads accepte aussi des bytes UTF-8)
+    _json_loads = json.loads
+    _JSONDecodeError = json.JSONDecodeError
+
+try:  # pyahocorasick (C) : recherche multi-motifs en une passe par document
+    import ahocorasick
+except ImportError:  # repli : regex d'alternation compilée
+    ahocorasick = None
 
 
 # =========================================================
 # 1) XML — utilitaires
 # =========================================================
 
-def strip_xml_namespaces(root: ET.Element) -> None:
+# Taille des blocs envoyés au parser XML (octets).
+_XML_FEED_SIZE = 1 << 16
+
+
+class _XMLTextCollector:
     """
-    Supprime les namespaces XML "in-place" pour simplifier les recherches XPath.
+    Cible ("target") de parser XML : collecte les mots des text nodes.
 
-    Exemple :
-    - {http://...}CONTENU  --> CONTENU
+    Le parser appelle data() pour chaque morceau de texte, dans l'ordre
+    du document, sans construire d'arbre. Un text node peut arriver en
+    plusieurs morceaux (entités, frontières de blocs) : ils sont accumulés
+    puis découpés en mots à la balise suivante (start/end).
+    Commentaires et PI sont ignorés (pas de méthode comment()/pi()).
     """
-    for elem in root.iter():
-        if "}" in elem.tag:
-            elem.tag = elem.tag.split("}", 1)[1]
+
+    def __init__(self) -> None:
+        self.words: List[str] = []
+        self._pending: List[str] = []
+        self.data = self._pending.append
+
+    def _flush(self, *_: Any) -> None:
+        if self._pending:
+            self.words.extend("".join(self._pending).split())
+            self._pending.clear()
+
+    start = _flush
+    end = _flush
+
+    def close(self) -> str:
+        self._flush()
+        return " ".join(self.words)
 
 
 def extract_text_from_xml(xml_path: str, remove_namespaces: bool = True) -> str:
@@ -64,17 +109,19 @@ def extract_text_from_xml(xml_path: str, remove_namespaces: bool = True) -> str:
     Extrait de manière robuste tout le texte d'un fichier XML.
 
     Stratégie (POC volontairement simple) :
-    - parsing ElementTree
-    - optionnel : suppression des namespaces
-    - concaténation de tous les text nodes (elem.text + elem.tail)
-    - normalisation légère des espaces
+    - parsing en flux avec un parser "target" (lxml, repli ElementTree si lxml absent) :
+      aucun élément construit, mémoire indépendante de la taille de l'arbre
+    - concaténation de tous les text nodes (elem.text + elem.tail), dans l'ordre du document
+    - normalisation légère des espaces : chaque text node est découpé en mots
+      (str.split) au fil de l'eau, un seul " ".join final suffit
 
     Paramètres
     ----------
     xml_path : str
         Chemin vers le fichier XML.
     remove_namespaces : bool
-        Si True, supprime les namespaces avant extraction.
+        Conservé pour compatibilité : les tags (donc les namespaces)
+        n'interviennent pas dans le texte extrait.
 
     Retour
     ------
@@ -83,24 +130,19 @@ def extract_text_from_xml(xml_path: str, remove_namespaces: bool = True) -> str:
         Pour un usage "propre", préférer le corpus chunké JSONL (script 8).
     """
     try:
-        tree = ET.parse(xml_path)
-        root = tree.getroot()
-
-        if remove_namespaces:
-            strip_xml_namespaces(root)
-
-        parts: List[str] = []
-        for elem in root.iter():
-            if elem.text and elem.text.strip():
-                parts.append(elem.text.strip())
-            if elem.tail and elem.tail.strip():
-                parts.append(elem.tail.strip())
-
-        text = " ".join(parts)
-        text = re.sub(r"\s+", " ", text).strip()
-        return text
-
-    except ET.ParseError:
+        parser = ET.XMLParser(target=_XMLTextCollector())
+        with open(xml_path, "rb") as f:
+            while True:
+                block = f.read(_XML_FEED_SIZE)
+                if not block:
+                    break
+                parser.feed(block)
+
+        # Mots sans espaces : le " ".join de close() est déjà normalisé,
+        # pas de passe regex supplémentaire sur tout le document.
+        return parser.close()
+
+    except _XML_PARSE_ERRORS:
         return ""
     except OSError:
         return ""
@@ -110,6 +152,10 @@ def extract_text_from_xml(xml_path: str, remove_namespaces: bool = True) -> str:
 # 2) Chargement corpus XML
 # =========================================================
 
+# Nombre de fichiers envoyés par tâche au pool de processus.
+_XML_POOL_CHUNKSIZE = 32
+
+
 def iter_xml_files(data_root: str, limit_files: Optional[int] = None) -> Iterable[str]:
     """
     Itère sur les fichiers .xml d'un répertoire (récursif).
@@ -125,28 +171,65 @@ def iter_xml_files(data_root: str, limit_files: Optional[int] = None) -> Iterabl
     ------
     str
         Chemins complets vers les fichiers XML.
+
+    Notes
+    -----
+    Parcours via os.scandir (DirEntry : type mis en cache, pas de stat par
+    fichier), dans le même ordre qu'os.walk (top-down) : fichiers du dossier
+    courant, puis chaque sous-dossier. Comme os.walk, les dossiers illisibles
+    sont ignorés et les liens symboliques vers des dossiers ne sont pas suivis.
     """
     count = 0
-    for root_dir, _, files in os.walk(data_root):
-        for name in files:
-            if not name.lower().endswith(".xml"):
+    stack = [data_root]
+    while stack:
+        current = stack.pop()
+        try:
+            with os.scandir(current) as it:
+                entries = list(it)
+        except OSError:
+            continue
+
+        subdirs: List[str] = []
+        for entry in entries:
+            try:
+                is_dir = entry.is_dir()
+            except OSError:
+                is_dir = False
+
+            if is_dir:
+                if not entry.is_symlink():
+                    subdirs.append(entry.path)
                 continue
-            full_path = os.path.join(root_dir, name)
-            yield full_path
+
+            if entry.name[-4:].lower() != ".xml":
+                continue
+            yield entry.path
 
             count += 1
             if limit_files is not None and count >= limit_files:
                 return
 
+        # Ordre inverse : le premier sous-dossier listé est dépilé en premier.
+        stack.extend(reversed(subdirs))
 
-def load_documents_from_xml(
+
+def load_documents_soa(
     data_root: str,
     min_text_len: int = 200,
     limit_files: Optional[int] = None,
     remove_namespaces: bool = True,
-) -> List[Dict[str, Any]]:
+    n_workers: Optional[int] = None,
+    required_substring: Optional[str] = None,
+) -> Tuple[List[str], List[str], List[str]]:
     """
-    Charge un corpus XML (documents bruts, non chunkés).
+    Charge un corpus XML sous forme de listes parallèles ("structure of arrays").
+
+    Pour un benchmark qui garde le corpus en mémoire, les boucles de métriques
+    indexent directement texts_lc[i] (cf. metrics.*_soa) au lieu de faire
+    des accès dict par document.
+
+    Le parsing XML étant CPU-bound, les fichiers sont répartis sur un pool
+    de processus (les threads n'apportent rien à cause du GIL).
 
     Paramètres
     ----------
@@ -157,20 +240,116 @@ def load_documents_from_xml(
     limit_files : int | None
         Limite de fichiers XML parcourus (debug).
     remove_namespaces : bool
-        Si True, supprime les namespaces XML avant extraction.
+        Conservé pour compatibilité (sans effet, cf. extract_text_from_xml).
+    n_workers : int | None
+        Nombre de processus. None => os.cpu_count() ; 1 => chargement séquentiel
+        (pratique pour déboguer).
+    required_substring : str | None
+        Si fourni, ne conserve que les documents dont le texte contient cette
+        sous-chaîne (insensible à la casse). Le test est fait dans chaque worker,
+        juste après l'extraction : les textes hors périmètre ne sont ni renvoyés
+        au processus principal ni gardés en mémoire.
 
     Retour
     ------
-    List[dict]
-        Liste de documents : {"doc_id": <path>, "text": <texte>}
+    (doc_ids, texts, texts_lc)
+        Trois listes alignées : chemin du XML, texte extrait, texte en minuscules.
     """
-    documents: List[Dict[str, Any]] = []
+    xml_paths = list(iter_xml_files(data_root, limit_files=limit_files))
+
+    required_lc = required_substring.lower() if required_substring else None
+
+    if n_workers is None:
+        n_workers = os.cpu_count() or 1
 
-    for xml_path in iter_xml_files(data_root, limit_files=limit_files):
-        text = extract_text_from_xml(xml_path, remove_namespaces=remove_namespaces)
+    if n_workers <= 1 or len(xml_paths) <= 1:
+        texts = map(
+            _extract_text_if_contains,
+            xml_paths,
+            repeat(remove_namespaces),
+            repeat(required_lc),
+        )
+        return _collect_soa(xml_paths, texts, min_text_len)
+
+    # chunksize large : amortit le coût IPC (pickling) de chaque tâche.
+    with ProcessPoolExecutor(max_workers=n_workers) as ex:
+        texts = ex.map(
+            _extract_text_if_contains,
+            xml_paths,
+            repeat(remove_namespaces),
+            repeat(required_lc),
+            chunksize=_XML_POOL_CHUNKSIZE,
+        )
+        return _collect_soa(xml_paths, texts, min_text_len)
+
+
+def _extract_text_if_contains(
+    xml_path: str,
+    remove_namespaces: bool,
+    required_lc: Optional[str],
+) -> str:
+    """
+    Tâche du pool : texte extrait, ou "" s'il ne contient pas required_lc
+    (sous-chaîne en minuscules ; None => aucun filtre).
+    """
+    text = extract_text_from_xml(xml_path, remove_namespaces)
+    if required_lc is not None and required_lc not in text.lower():
+        return ""
+    return text
+
+
+def _collect_soa(
+    xml_paths: Sequence[str],
+    texts: Iterable[str],
+    min_text_len: int,
+) -> Tuple[List[str], List[str], List[str]]:
+    """Assemble les listes (doc_ids, texts, texts_lc) en appliquant le seuil de longueur."""
+    doc_ids: List[str] = []
+    kept_texts: List[str] = []
+    texts_lc: List[str] = []
+
+    for xml_path, text in zip(xml_paths, texts):
         if text and len(text) >= min_text_len:
-            documents.append({"doc_id": xml_path, "text": text})
+            doc_ids.append(xml_path)
+            kept_texts.append(text)
+            texts_lc.append(text.lower())
+
+    return doc_ids, kept_texts, texts_lc
 
+
+def load_documents_from_xml(
+    data_root: str,
+    min_text_len: int = 200,
+    limit_files: Optional[int] = None,
+    remove_namespaces: bool = True,
+    n_workers: Optional[int] = None,
+    required_substring: Optional[str] = None,
+) -> List[Dict[str, Any]]:
+    """
+    Charge un corpus XML (documents bruts, non chunkés).
+
+    Surcouche "liste de dicts" de load_documents_soa (mêmes paramètres).
+
+    Retour
+    ------
+    List[dict]
+        Liste de documents : {"doc_id": <path>, "text": <texte>}
+        (+ champs en minuscules de prepare_documents : _text_lc, ...)
+    """
+    doc_ids, texts, texts_lc = load_documents_soa(
+        data_root,
+        min_text_len=min_text_len,
+        limit_files=limit_files,
+        remove_namespaces=remove_namespaces,
+        n_workers=n_workers,
+        required_substring=required_substring,
+    )
+
+    documents = [
+        {"doc_id": doc_id, "text": text, "_text_lc": text_lc}
+        for doc_id, text, text_lc in zip(doc_ids, texts, texts_lc)
+    ]
+    prepare_documents(documents)
     return documents
 
 
@@ -178,6 +357,64 @@ def load_documents_from_xml(
 # 3) Chargement corpus JSONL (chunks)
 # =========================================================
 
+# Taille des blocs lus en binaire (1 Mio) : compromis appels système / mémoire.
+_READ_CHUNK_SIZE = 1 << 20
+
+
+def iter_jsonl_lines(jsonl_path: str, chunk_size: int = _READ_CHUNK_SIZE) -> Iterable[bytes]:
+    """
+    Itère sur les lignes brutes (bytes, sans "\\n") d'un fichier JSONL.
+
+    Lecture par blocs binaires + recherche des sauts de ligne via bytes.find :
+    - aucun décodage UTF-8 ligne à ligne (le décodeur JSON lit les bytes),
+    - la fin de bloc incomplète est conservée dans une liste et jointe
+      uniquement lorsqu'un saut de ligne est trouvé (pas de buffer += bloc).
+
+    Paramètres
+    ----------
+    jsonl_path : str
+        Chemin vers le JSONL.
+    chunk_size : int
+        Taille des blocs lus (octets).
+
+    Yields
+    ------
+    bytes
+        Une ligne du fichier (éventuellement vide).
+    """
+    pending: List[bytes] = []
+
+    with open(jsonl_path, "rb") as f:
+        while True:
+            block = f.read(chunk_size)
+            if not block:
+                break
+
+            start = 0
+            nl = block.find(b"\n")
+            if nl < 0:
+                pending.append(block)
+                continue
+
+            if pending:
+                pending.append(block[:nl])
+                yield b"".join(pending)
+                pending = []
+                start = nl + 1
+                nl = block.find(b"\n", start)
+
+            while nl >= 0:
+                yield block[start:nl]
+                start = nl + 1
+                nl = block.find(b"\n", start)
+
+            if start < len(block):
+                pending.append(block[start:])
+
+    if pending:
+        yield b"".join(pending)
+
+
 def load_documents_from_jsonl(
     jsonl_path: str,
     min_text_len: int = 50,
@@ -199,42 +436,73 @@ def load_documents_from_jsonl(
     ------
     List[dict]
         Liste de chunks (dict). On conserve tous les champs présents,
-        mais on garantit au minimum 'doc_id' et 'text'.
+        mais on garantit au minimum 'doc_id' et 'text'
+        (+ champs en minuscules de prepare_documents : _text_lc, ...).
     """
     if not os.path.exists(jsonl_path):
         raise FileNotFoundError(f"JSONL introuvable : {jsonl_path}")
 
     chunks: List[Dict[str, Any]] = []
-    with open(jsonl_path, "r", encoding="utf-8") as f:
-        for i, line in enumerate(f, start=1):
-            if limit_lines is not None and len(chunks) >= limit_lines:
-                break
+    if limit_lines is not None and limit_lines <= 0:
+        return chunks
+
+    # Boucle chaude : noms résolus une fois en variables locales.
+    append = chunks.append
+    loads = _json_loads
+    decode_error = _JSONDecodeError
+    min_len = min_text_len
+
+    for line in iter_jsonl_lines(jsonl_path):
+        # Pas de strip() : les espaces (ex: "\r") sont tolérés par le décodeur,
+        # une ligne vide lève simplement _JSONDecodeError.
+        try:
+            obj = loads(line)
+        except decode_error:
+            continue
+
+        try:
+            doc_id = obj["doc_id"]
+            text = obj["text"]
+        except (KeyError, TypeError):  # champ absent / ligne JSON non-objet
+            continue
+
+        if not doc_id or not isinstance(text, str) or len(text) < min_len:
+            continue
+
+        append(obj)
+        if len(chunks) == limit_lines:
+            break
+
+    prepare_documents(chunks)
+    return chunks
 
-            line = line.strip()
-            if not line:
-                continue
 
-            try:
-                obj = json.loads(line)
-            except json.JSONDecodeError:
-                continue
+# =========================================================
+# 4) Filtrage métier minimal (optionnel)
+# =========================================================
 
-            doc_id = obj.get("doc_id")
-            text = obj.get("text")
+# Champ de filtrage -> clé de cache de sa version en minuscules
+_LOWERCASE_FIELDS = {
+    "text": "_text_lc",
+    "meta.titre": "_titre_lc",
+    "doc_id": "_doc_id_lc",
+}
 
-            if not doc_id or not isinstance(text, str):
-                continue
-            if len(text) < min_text_len:
-                continue
 
-            chunks.append(obj)
-
-    return chunks
+def prepare_documents(documents: Iterable[Dict[str, Any]]) -> None:
+    """
+    Pré-calcule "in-place" les champs de filtrage en minuscules.
 
+    Ajoute à chaque document/chunk : _text_lc, _titre_lc, _doc_id_lc
+    (un champ déjà présent est conservé, ex: _text_lc issu de load_documents_soa).
+    À appeler une fois après chargement : les filtres (et métriques)
+    réutilisent ces champs au lieu d'allouer un .lower() à chaque appel.
+    """
+    for doc in documents:
+        for key, cache_key in _LOWERCASE_FIELDS.items():
+            if cache_key not in doc:
+                doc[cache_key] = _get_field(doc, key).lower()
 
-# =========================================================
-# 4) Filtrage métier minimal (optionnel)
-# =========================================================
 
 def filter_documents_by_substring(
     documents: Sequence[Dict[str, Any]],
@@ -267,25 +535,88 @@ def filter_documents_by_substring(
 
     needle = required_substring.lower()
 
-    def get_field(doc: Dict[str, Any], key: str) -> str:
-        if key == "text":
-            return str(doc.get("text") or "")
-        if key == "doc_id":
-            return str(doc.get("doc_id") or "")
-        if key == "meta.titre":
-            meta = doc.get("meta") or {}
-            return str(meta.get("titre") or "")
-        return ""
+    out: List[Dict[str, Any]] = []
+    for doc in documents:
+        if any(needle in _get_field_lc(doc, k) for k in search_in):
+            out.append(doc)
+
+    return out
+
+
+def filter_documents_by_substrings(
+    documents: Sequence[Dict[str, Any]],
+    needles: Sequence[str],
+    search_in: Sequence[str] = ("text", "meta.titre", "doc_id"),
+) -> List[Dict[str, Any]]:
+    """
+    Variante multi-motifs : conserve les documents/chunks contenant
+    au moins une des sous-chaînes (case-insensitive).
+
+    Toutes les sous-chaînes sont cherchées en une seule passe par document :
+    automate Aho-Corasick (pyahocorasick) si disponible, sinon une regex
+    d'alternation compilée.
+
+    Paramètres
+    ----------
+    documents : Sequence[dict]
+        Documents ou chunks.
+    needles : Sequence[str]
+        Sous-chaînes à rechercher. Si vide (ou contient "") => aucun filtre.
+    search_in : Sequence[str]
+        Champs à inspecter (cf. filter_documents_by_substring).
+
+    Retour
+    ------
+    List[dict]
+        Sous-ensemble filtré.
+    """
+    if not needles or not all(needles):
+        return list(documents)
+
+    if ahocorasick is not None:
+        automaton = ahocorasick.Automaton()
+        for n in needles:
+            automaton.add_word(n.lower(), n)
+        automaton.make_automaton()
+
+        def contains_any(haystack: str) -> bool:
+            return next(automaton.iter(haystack), None) is not None
+    else:
+        pattern = re.compile("|".join(re.escape(n.lower()) for n in needles))
+
+        def contains_any(haystack: str) -> bool:
+            return pattern.search(haystack) is not None
 
     out: List[Dict[str, Any]] = []
     for doc in documents:
-        haystack = " ".join(get_field(doc, k) for k in search_in).lower()
-        if needle in haystack:
+        if any(contains_any(_get_field_lc(doc, k)) for k in search_in):
             out.append(doc)
 
     return out
 
 
+def _get_field(doc: Dict[str, Any], key: str) -> str:
+    """Valeur textuelle d'un champ de filtrage ("text", "doc_id", "meta.titre")."""
+    if key == "text":
+        return str(doc.get("text") or "")
+    if key == "doc_id":
+        return str(doc.get("doc_id") or "")
+    if key == "meta.titre":
+        meta = doc.get("meta") or {}
+        return str(meta.get("titre") or "")
+    return ""
+
+
+def _get_field_lc(doc: Dict[str, Any], key: str) -> str:
+    """Champ de filtrage en minuscules (cache de prepare_documents si présent)."""
+    cache_key = _LOWERCASE_FIELDS.get(key)
+    if cache_key is not None:
+        cached = doc.get(cache_key)
+        if cached is not None:
+            return cached
+    return _get_field(doc, key).lower()
+
+
 # =========================================================
 # 5) API unique (recommandée)
 # =========================================================
@@ -296,6 +627,7 @@ def load_documents(
     min_text_len: int = 200,
     limit: Optional[int] = None,
     remove_namespaces: bool = True,
+    n_workers: Optional[int] = None,
 ) -> List[Dict[str, Any]]:
     """
     Point d'entrée unique pour charger le corpus.
@@ -311,7 +643,9 @@ def load_documents(
     limit : int | None
         Limite de fichiers (xml) ou de lignes (jsonl) pour debug.
     remove_namespaces : bool
-        (xml) suppression des namespaces.
+        (xml) conservé pour compatibilité, sans effet (cf. extract_text_from_xml).
+    n_workers : int | None
+        (xml) nombre de processus de parsing (None => os.cpu_count()).
 
     Retour
     ------
@@ -325,6 +659,7 @@ def load_documents(
             min_text_len=min_text_len,
             limit_files=limit,
             remove_namespaces=remove_namespaces,
+            n_workers=n_workers,
         )
     if src == "jsonl":
         return load_documents_from_jsonl(
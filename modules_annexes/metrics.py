@@ -10,6 +10,7 @@ Il est volontairement simple et explicable.
 """
 
 import math
+from itertools import accumulate
 
 
 # =========================================================
@@ -29,6 +30,43 @@ def is_relevant(document_text, relevant_keywords):
     return any(keyword.lower() in text for keyword in relevant_keywords)
 
 
+def lowercase_keywords(relevant_keywords):
+    """
+    Met les mots-clés en minuscules une seule fois par requête.
+
+    Les mots-clés redondants sont écartés : si un mot-clé en contient
+    un autre (ex: "contestations" / "contestation"), sa présence implique
+    celle du plus court, le test any(...) reste donc identique avec
+    moins de recherches par document.
+    """
+    lowered = list(dict.fromkeys(keyword.lower() for keyword in relevant_keywords))
+    return [
+        keyword for keyword in lowered
+        if not any(other != keyword and other in keyword for other in lowered)
+    ]
+
+
+def _ranked_texts_lc(results):
+    """
+    Textes en minuscules, dans l'ordre du ranking, pour des résultats
+    (doc, score) : doc["_text_lc"] si présent, sinon doc["text"].lower().
+    """
+    for doc, _ in results:
+        text = doc.get("_text_lc")
+        if text is None:
+            text = doc["text"].lower()
+        yield text
+
+
+def _ranked_texts_lc_soa(results, texts_lc):
+    """
+    Textes en minuscules, dans l'ordre du ranking, pour des résultats
+    (index, score) sur un corpus en listes parallèles (load_documents_soa).
+    """
+    for idx, _ in results:
+        yield texts_lc[idx]
+
+
 # =========================================================
 # 2. RECALL@K
 # =========================================================
@@ -39,9 +77,25 @@ def recall_at_k(results, relevant_keywords, k):
     - 1 si au moins un document pertinent est présent dans le top-k
     - 0 sinon
     """
-    top_k = results[:k]
-    for doc, _ in top_k:
-        if is_relevant(doc["text"], relevant_keywords):
+    return _recall(
+        _ranked_texts_lc(results[:k]),
+        lowercase_keywords(relevant_keywords),
+    )
+
+
+def recall_at_k_soa(results, texts_lc, relevant_keywords, k):
+    """
+    Recall@k sur résultats (index, score) et textes en minuscules alignés.
+    """
+    return _recall(
+        _ranked_texts_lc_soa(results[:k], texts_lc),
+        lowercase_keywords(relevant_keywords),
+    )
+
+
+def _recall(ranked_texts_lc, lowered_keywords):
+    for text in ranked_texts_lc:
+        if any(keyword in text for keyword in lowered_keywords):
             return 1
     return 0
 
@@ -56,8 +110,25 @@ def reciprocal_rank(results, relevant_keywords):
     - 1 / rang du premier document pertinent
     - 0 s'il n'y en a aucun
     """
-    for rank, (doc, _) in enumerate(results, start=1):
-        if is_relevant(doc["text"], relevant_keywords):
+    return _reciprocal_rank(
+        _ranked_texts_lc(results),
+        lowercase_keywords(relevant_keywords),
+    )
+
+
+def reciprocal_rank_soa(results, texts_lc, relevant_keywords):
+    """
+    MRR sur résultats (index, score) et textes en minuscules alignés.
+    """
+    return _reciprocal_rank(
+        _ranked_texts_lc_soa(results, texts_lc),
+        lowercase_keywords(relevant_keywords),
+    )
+
+
+def _reciprocal_rank(ranked_texts_lc, lowered_keywords):
+    for rank, text in enumerate(ranked_texts_lc, start=1):
+        if any(keyword in text for keyword in lowered_keywords):
             return 1 / rank
     return 0
 
@@ -66,6 +137,18 @@ def reciprocal_rank(results, relevant_keywords):
 # 4. nDCG@K
 # =========================================================
 
+# Discounts 1 / log2(i + 1) pré-calculés pour les rangs 1.._MAX_RANK
+# (_DISCOUNT[0] inutilisé), et leurs sommes cumulées : IDCG en O(1).
+_MAX_RANK = 1024
+_DISCOUNT = [0.0] + [1 / math.log2(i + 1) for i in range(1, _MAX_RANK + 1)]
+_CUM_DISCOUNT = list(accumulate(_DISCOUNT))
+
+
+def _discount(i):
+    """1 / log2(i + 1), lu dans la table si le rang est couvert."""
+    return _DISCOUNT[i] if i <= _MAX_RANK else 1 / math.log2(i + 1)
+
+
 def ndcg_at_k(results, relevant_keywords, k):
     """
     nDCG@k (version binaire, normalisée) :
@@ -78,23 +161,41 @@ def ndcg_at_k(results, relevant_keywords, k):
     - pertinence binaire (pertinent / non pertinent)
     - oracle basé sur mots-clés
     """
+    return _ndcg(
+        _ranked_texts_lc(results[:k]),
+        lowercase_keywords(relevant_keywords),
+    )
+
+
+def ndcg_at_k_soa(results, texts_lc, relevant_keywords, k):
+    """
+    nDCG@k sur résultats (index, score) et textes en minuscules alignés.
+    """
+    return _ndcg(
+        _ranked_texts_lc_soa(results[:k], texts_lc),
+        lowercase_keywords(relevant_keywords),
+    )
+
+
+def _ndcg(ranked_texts_lc, lowered_keywords):
     dcg = 0.0
-    relevances = []
+    hits = 0
 
     # DCG réel
-    for i, (doc, _) in enumerate(results[:k], start=1):
-        if is_relevant(doc["text"], relevant_keywords):
-            dcg += 1 / math.log2(i + 1)
-            relevances.append(1)
+    for i, text in enumerate(ranked_texts_lc, start=1):
+        if any(keyword in text for keyword in lowered_keywords):
+            dcg += _discount(i)
+            hits += 1
 
     # Aucun document pertinent trouvé
-    if not relevances:
+    if not hits:
         return 0.0
 
     # IDCG : documents pertinents idéalement classés en tête
-    idcg = 0.0
-    for i in range(1, len(relevances) + 1):
-        idcg += 1 / math.log2(i + 1)
+    if hits <= _MAX_RANK:
+        idcg = _CUM_DISCOUNT[hits]
+    else:
+        idcg = sum(_discount(i) for i in range(1, hits + 1))
 
     return dcg / idcg
 
@@ -17,9 +17,24 @@ Objectif :
 Cette brique alimente ensuite le retrieval (BM25, dense, hybride).
 """
 
+import os
+import tempfile
+
 import yaml
 import re
 
+try:  # orjson : cache binaire du dictionnaire (optionnel)
+    import orjson
+except ImportError:
+    orjson = None
+
+# Loader YAML en C (libyaml) si disponible, sinon loader Python
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+# Regex pré-compilée (appelée à chaque requête)
+_NONALPHA_RE = re.compile(r"[^a-zàâçéèêëîïôûùüÿñæœ\s]")
+
 
 # =========================================================
 # 1. CHARGEMENT DU DICTIONNAIRE MÉTIER
@@ -29,14 +44,116 @@ def load_juridical_dictionary(path):
     """
     Charge le dictionnaire juridique YAML.
 
+    Cache :
+    - si orjson est installé, une copie est écrite à côté (<path>.orjson)
+      avec la date de modification du YAML
+    - tant que le YAML n'a pas changé, c'est cette copie qui est relue
+      (pas de parsing YAML)
+
     Retour :
     - dictionnaire Python
     """
+    cache_path = path + ".orjson"
+    stat = os.stat(path)
+
+    if orjson is not None:
+        data = _read_dictionary_cache(cache_path, stat)
+        if data is not None:
+            return data
+
     with open(path, "r", encoding="utf-8") as f:
-        return yaml.safe_load(f)
+        data = yaml.load(f, Loader=_YAML_LOADER)
+
+    if orjson is not None:
+        _write_dictionary_cache(cache_path, stat, data)
+
+    return data
+
+
+def _read_dictionary_cache(cache_path, stat):
+    """
+    Relit le cache orjson s'il correspond encore au YAML source, sinon None.
+    """
+    try:
+        with open(cache_path, "rb") as f:
+            cached = orjson.loads(f.read())
+    except (OSError, orjson.JSONDecodeError):
+        return None
+
+    if not isinstance(cached, dict):
+        return None
+    if cached.get("source_mtime_ns") != stat.st_mtime_ns:
+        return None
+    if cached.get("source_size") != stat.st_size:
+        return None
+
+    return cached.get("data")
+
+
+def _write_dictionary_cache(cache_path, stat, data):
+    """
+    Écrit le cache orjson de façon atomique (fichier temporaire + os.replace).
+
+    Best effort : si le contenu ne fait pas l'aller-retour JSON à l'identique
+    (ex: dates YAML) ou si le dossier n'est pas inscriptible, pas de cache.
+    """
+    try:
+        payload = orjson.dumps({
+            "source_mtime_ns": stat.st_mtime_ns,
+            "source_size": stat.st_size,
+            "data": data,
+        })
+    except TypeError:
+        return
+    if orjson.loads(payload)["data"] != data:
+        return
+
+    try:
+        fd, tmp_path = tempfile.mkstemp(
+            dir=os.path.dirname(os.path.abspath(cache_path)),
+            prefix=os.path.basename(cache_path) + ".",
+            suffix=".tmp",
+        )
+    except OSError:
+        return
+
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(payload)
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+
+
+# Dictionnaire par défaut : chargé à la demande (aucune I/O à l'import)
+DICTIONARY_PATH = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)),
+    "juridical_dictionary.yml",
+)
+_dictionary = None
+
+
+def get_dictionary():
+    """
+    Retourne le dictionnaire par défaut (DICTIONARY_PATH), chargé au premier appel.
+    """
+    global _dictionary
+    if _dictionary is None:
+        _dictionary = load_juridical_dictionary(DICTIONARY_PATH)
+    return _dictionary
 
 
-dictionary = load_juridical_dictionary("juridical_dictionary.yml")
+def __getattr__(name):
+    """
+    Compatibilité : `query_understanding.dictionary` reste accessible,
+    mais n'est chargé qu'au premier accès.
+    """
+    if name == "dictionary":
+        return get_dictionary()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 # =========================================================
@@ -48,46 +165,90 @@ def normalize_text(text):
     Normalisation simple :
     - minuscules
     - suppression des caractères spéciaux
+    - espaces multiples réduits (split/join, sans second passage regex)
     """
-    text = text.lower()
-    text = re.sub(r"[^a-zàâçéèêëîïôûùüÿñæœ\s]", " ", text)
-    return re.sub(r"\s+", " ", text).strip()
+    text = _NONALPHA_RE.sub(" ", text.lower())
+    return " ".join(text.split())
 
 
 # =========================================================
 # 3. DÉTECTION D’INTENTION
 # =========================================================
 
-def detect_intention(query, dictionary):
+def compile_intent_pattern(dictionary):
+    """
+    Compile toutes les phrases d'intention en une seule regex.
+
+    Une branche par intention, dans l'ordre du dictionnaire :
+    (?=.*?(?:phrase1|phrase2))(?P<i0>) | ...
+    La première branche qui réussit donne l'intention, ce qui conserve
+    la priorité de l'ancienne double boucle (ordre du dictionnaire).
+
+    Appelée à chaque requête : re.compile réutilise la regex déjà compilée
+    pour une chaîne identique (cache interne de re), et un dictionnaire
+    modifié en place donne une nouvelle regex.
+
+    Retour :
+    - (regex compilée ou None, liste des clés d'intention par groupe)
+    """
+    branches = []
+    intent_keys = []
+
+    for intent_key, intent_data in dictionary.items():
+        phrases = intent_data["intentions_utilisateur"]
+        if not phrases:
+            continue
+        alternation = "|".join(re.escape(phrase) for phrase in phrases)
+        branches.append(f"(?=.*?(?:{alternation}))(?P<i{len(intent_keys)}>)")
+        intent_keys.append(intent_key)
+
+    if not branches:
+        return None, intent_keys
+
+    return re.compile("(?s)^(?:" + "|".join(branches) + ")"), intent_keys
+
+
+def detect_intention(query, dictionary=None):
     """
     Détecte si la requête correspond à une intention métier connue.
+    (dictionary=None => dictionnaire par défaut, cf. get_dictionary)
 
     Retour :
     - clé d'intention (ex: 'rupture_sans_preavis')
     - None sinon
     """
+    if dictionary is None:
+        dictionary = get_dictionary()
+
     normalized_query = normalize_text(query)
 
-    for intent_key, intent_data in dictionary.items():
-        for phrase in intent_data["intentions_utilisateur"]:
-            if phrase in normalized_query:
-                return intent_key
+    pattern, intent_keys = compile_intent_pattern(dictionary)
+    if pattern is None:
+        return None
+
+    match = pattern.match(normalized_query)
+    if match is None:
+        return None
 
-    return None
+    return intent_keys[int(match.lastgroup[1:])]
 
 
 # =========================================================
 # 4. ENRICHISSEMENT DE LA REQUÊTE
 # =========================================================
 
-def enrich_query(query, intent_key, dictionary):
+def enrich_query(query, intent_key, dictionary=None):
     """
     Enrichit la requête avec les concepts juridiques associés
     à l’intention détectée.
+    (dictionary=None => dictionnaire par défaut, cf. get_dictionary)
 
     Retour :
     - requête enrichie (str)
     """
+    if dictionary is None:
+        dictionary = get_dictionary()
+
     intent_data = dictionary[intent_key]
 
     enriched_terms = (
@@ -103,10 +264,14 @@ def enrich_query(query, intent_key, dictionary):
 # 5. PIPELINE COMPLET
 # =========================================================
 
-def process_user_query(query, dictionary):
+def process_user_query(query, dictionary=None):
     """
     Pipeline complet de compréhension de requête.
+    (dictionary=None => dictionnaire par défaut, cf. get_dictionary)
     """
+    if dictionary is None:
+        dictionary = get_dictionary()
+
     intent = detect_intention(query, dictionary)
 
     if intent is None:
@@ -134,7 +299,7 @@ if __name__ == "__main__":
 
     user_query = "Dans quels cas un CDI peut-il être rompu sans préavis ?"
 
-    result = process_user_query(user_query, dictionary)
+    result = process_user_query(user_query, get_dictionary())
 
     print("\n=== RÉSULTAT QUERY UNDERSTANDING ===")
     for k, v in result.items():